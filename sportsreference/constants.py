@@ -9,3 +9,6 @@ REGULAR_SEASON = 'Reg'
 POST_SEASON = 'Post'
 CONFERENCE_TOURNAMENT = 'Conf-Tourney'
 NON_DI = 'Non-DI School'
+
+# The maximum number of team schedules to download at the same time.
+SCHEDULE_WORKERS = 8
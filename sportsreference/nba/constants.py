@@ -414,3 +414,7 @@ BOXSCORES_URL = ('https://www.basketball-reference.com/boxscores/'
 PLAYER_URL = 'https://www.basketball-reference.com/players/%s/%s.html'
 
 ROSTER_URL = 'https://www.basketball-reference.com/teams/%s/%s.html'
+
+# The number of seconds a downloaded season page is reused for before it is
+# downloaded again.
+SEASON_PAGE_MAX_AGE = 10 * 60
@@ -1,9 +1,47 @@
-from .constants import PARSING_SCHEME, SEASON_PAGE_URL
+import time
+from .constants import SEASON_PAGE_MAX_AGE, SEASON_PAGE_URL
 from pyquery import PyQuery as pq
 from sportsreference import utils
 from urllib.error import HTTPError
 
 
+# The most recently downloaded season pages, keyed by URL. Each value is a
+# tuple of the time the page was downloaded and the parsed page.
+_SEASON_PAGES = {}
+_MAX_SEASON_PAGES = 8
+
+
+def _pull_season_page(url):
+    """
+    Download and parse a season's page.
+
+    The parsed page is reused for up to SEASON_PAGE_MAX_AGE seconds to prevent
+    the same season from being downloaded every time the teams are requested,
+    such as when creating multiple Team instances directly. Pages which can't
+    be downloaded raise an HTTPError and are not saved.
+
+    Parameters
+    ----------
+    url : string
+        The URL of the requested season's page.
+
+    Returns
+    -------
+    PyQuery object
+        Returns a PyQuery object of the season's page.
+    """
+    cached = _SEASON_PAGES.get(url)
+    if cached and time.time() - cached[0] < SEASON_PAGE_MAX_AGE:
+        return cached[1]
+    doc = pq(url)
+    _SEASON_PAGES.pop(url, None)
+    if len(_SEASON_PAGES) >= _MAX_SEASON_PAGES:
+        # Drop the page which was downloaded first.
+        _SEASON_PAGES.pop(next(iter(_SEASON_PAGES)))
+    _SEASON_PAGES[url] = (time.time(), doc)
+    return doc
+
+
 def _add_stats_data(teams_list, team_data_dict):
     """
     Add a team's stats row to a dictionary.
@@ -15,11 +53,11 @@ def _add_stats_data(teams_list, team_data_dict):
     ----------
     teams_list : generator
         A generator of all row items in a given table.
-    team_data_dict : {str: {'data': str, 'rank': int}} dictionary
+    team_data_dict : {str: {'data': list, 'rank': int}} dictionary
         A dictionary where every key is the team's abbreviation and every value
-        is another dictionary with a 'data' key which contains the string
-        version of the row data for the matched team, and a 'rank' key which is
-        the rank of the team.
+        is another dictionary with a 'data' key which contains a list of every
+        row element for the matched team, and a 'rank' key which is the rank of
+        the team.
 
     Returns
     -------
@@ -30,11 +68,12 @@ def _add_stats_data(teams_list, team_data_dict):
     # Teams are listed in terms of rank with the first team being #1
     rank = 1
     for team_data in teams_list:
-        abbr = utils._parse_field(PARSING_SCHEME, team_data, 'abbreviation')
+        link = team_data[0].find('.//a')
+        abbr = utils._parse_abbreviation_from_uri(link.get('href'))
         try:
-            team_data_dict[abbr]['data'] += team_data
+            team_data_dict[abbr]['data'].extend(team_data)
         except KeyError:
-            team_data_dict[abbr] = {'data': team_data, 'rank': rank}
+            team_data_dict[abbr] = {'data': list(team_data), 'rank': rank}
         rank += 1
     return team_data_dict
 
@@ -61,6 +100,7 @@ def _retrieve_all_teams(year):
         stats from, respectively.
     """
     team_data_dict = {}
+    doc = None
 
     if not year:
         year = utils._find_year_for_season('nba')
@@ -70,7 +110,7 @@ def _retrieve_all_teams(year):
         # instead.
         if year == 2021:
             try:
-                doc = pq(SEASON_PAGE_URL % year)
+                doc = _pull_season_page(SEASON_PAGE_URL % year)
             except HTTPError:
                 year = str(int(year) - 1)
         # If stats for the requested season do not exist yet (as is the case
@@ -79,7 +119,11 @@ def _retrieve_all_teams(year):
         if not utils._url_exists(SEASON_PAGE_URL % year) and \
            utils._url_exists(SEASON_PAGE_URL % str(int(year) - 1)):
             year = str(int(year) - 1)
-    doc = pq(SEASON_PAGE_URL % year)
+            doc = None
+    # Only download the season page if it wasn't already pulled while finding
+    # the season's year. Both stats tables are parsed from the same page.
+    if doc is None:
+        doc = _pull_season_page(SEASON_PAGE_URL % year)
     teams_list = utils._get_stats_table(doc, 'div#all_team-stats-base')
     opp_teams_list = utils._get_stats_table(doc, 'div#all_opponent-stats-base')
     if not teams_list and not opp_teams_list:
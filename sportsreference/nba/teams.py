@@ -1,8 +1,11 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from .constants import PARSING_SCHEME
-from ..decorators import float_property_decorator, int_property_decorator
+from ..decorators import int_property_decorator
 from .nba_utils import _retrieve_all_teams
+from operator import attrgetter
 from .. import utils
+from ..constants import SCHEDULE_WORKERS
 from .roster import Roster
 from .schedule import Schedule
 
@@ -18,15 +21,17 @@ class Team:
     If calling directly, the team's abbreviation needs to be passed. Otherwise,
     the Teams class will handle all arguments.
 
+    The season's page is reused for up to ten minutes after it is downloaded,
+    so stats updated on the site within that time aren't included.
+
     Parameters
     ----------
     team_name : string (optional)
         The name of the team to pull if being called directly.
-    team_data : string (optional)
-        A string containing all of the rows of stats for a given team. If
-        multiple tables are being referenced, this will be comprised of
-        multiple rows in a single string. Is only used when called directly
-        from the Teams class.
+    team_data : list (optional)
+        A list of the row elements of stats for a given team, with one row
+        from the team stats table followed by one row from the opponent stats
+        table. Is only used when called directly from the Teams class.
     rank : int (optional)
         A team's position in the league based on the number of points they
         obtained during the season. Is only used when called directly from the
@@ -34,55 +39,111 @@ class Team:
     year : string (optional)
         The requested year to pull stats from.
     """
+    # Every attribute which is parsed from the team's stats.
+    _STAT_FIELDS = (
+        '_abbreviation',
+        '_name',
+        '_games_played',
+        '_minutes_played',
+        '_field_goals',
+        '_field_goal_attempts',
+        '_field_goal_percentage',
+        '_three_point_field_goals',
+        '_three_point_field_goal_attempts',
+        '_three_point_field_goal_percentage',
+        '_two_point_field_goals',
+        '_two_point_field_goal_attempts',
+        '_two_point_field_goal_percentage',
+        '_free_throws',
+        '_free_throw_attempts',
+        '_free_throw_percentage',
+        '_offensive_rebounds',
+        '_defensive_rebounds',
+        '_total_rebounds',
+        '_assists',
+        '_steals',
+        '_blocks',
+        '_turnovers',
+        '_personal_fouls',
+        '_points',
+        '_opp_field_goals',
+        '_opp_field_goal_attempts',
+        '_opp_field_goal_percentage',
+        '_opp_three_point_field_goals',
+        '_opp_three_point_field_goal_attempts',
+        '_opp_three_point_field_goal_percentage',
+        '_opp_two_point_field_goals',
+        '_opp_two_point_field_goal_attempts',
+        '_opp_two_point_field_goal_percentage',
+        '_opp_free_throws',
+        '_opp_free_throw_attempts',
+        '_opp_free_throw_percentage',
+        '_opp_offensive_rebounds',
+        '_opp_defensive_rebounds',
+        '_opp_total_rebounds',
+        '_opp_assists',
+        '_opp_steals',
+        '_opp_blocks',
+        '_opp_turnovers',
+        '_opp_personal_fouls',
+        '_opp_points'
+    )
+    __slots__ = ('_year', '_rank', '_schedule') + _STAT_FIELDS
+
+    # Any field which isn't listed is saved as a string.
+    _FIELD_TYPES = {
+        'games_played': int,
+        'minutes_played': int,
+        'field_goals': int,
+        'field_goal_attempts': int,
+        'field_goal_percentage': float,
+        'three_point_field_goals': int,
+        'three_point_field_goal_attempts': int,
+        'three_point_field_goal_percentage': float,
+        'two_point_field_goals': int,
+        'two_point_field_goal_attempts': int,
+        'two_point_field_goal_percentage': float,
+        'free_throws': int,
+        'free_throw_attempts': int,
+        'free_throw_percentage': float,
+        'offensive_rebounds': int,
+        'defensive_rebounds': int,
+        'total_rebounds': int,
+        'assists': int,
+        'steals': int,
+        'blocks': int,
+        'turnovers': int,
+        'personal_fouls': int,
+        'points': int,
+        'opp_field_goals': int,
+        'opp_field_goal_attempts': int,
+        'opp_field_goal_percentage': float,
+        'opp_three_point_field_goals': int,
+        'opp_three_point_field_goal_attempts': int,
+        'opp_three_point_field_goal_percentage': float,
+        'opp_two_point_field_goals': int,
+        'opp_two_point_field_goal_attempts': int,
+        'opp_two_point_field_goal_percentage': float,
+        'opp_free_throws': int,
+        'opp_free_throw_attempts': int,
+        'opp_free_throw_percentage': float,
+        'opp_offensive_rebounds': int,
+        'opp_defensive_rebounds': int,
+        'opp_total_rebounds': int,
+        'opp_assists': int,
+        'opp_steals': int,
+        'opp_blocks': int,
+        'opp_turnovers': int,
+        'opp_personal_fouls': int,
+        'opp_points': int
+    }
+
     def __init__(self, team_name=None, team_data=None, rank=None, year=None):
         self._year = year
         self._rank = rank
-        self._abbreviation = None
-        self._name = None
-        self._games_played = None
-        self._minutes_played = None
-        self._field_goals = None
-        self._field_goal_attempts = None
-        self._field_goal_percentage = None
-        self._three_point_field_goals = None
-        self._three_point_field_goal_attempts = None
-        self._three_point_field_goal_percentage = None
-        self._two_point_field_goals = None
-        self._two_point_field_goal_attempts = None
-        self._two_point_field_goal_percentage = None
-        self._free_throws = None
-        self._free_throw_attempts = None
-        self._free_throw_percentage = None
-        self._offensive_rebounds = None
-        self._defensive_rebounds = None
-        self._total_rebounds = None
-        self._assists = None
-        self._steals = None
-        self._blocks = None
-        self._turnovers = None
-        self._personal_fouls = None
-        self._points = None
-        self._opp_field_goals = None
-        self._opp_field_goal_attempts = None
-        self._opp_field_goal_percentage = None
-        self._opp_three_point_field_goals = None
-        self._opp_three_point_field_goal_attempts = None
-        self._opp_three_point_field_goal_percentage = None
-        self._opp_two_point_field_goals = None
-        self._opp_two_point_field_goal_attempts = None
-        self._opp_two_point_field_goal_percentage = None
-        self._opp_free_throws = None
-        self._opp_free_throw_attempts = None
-        self._opp_free_throw_percentage = None
-        self._opp_offensive_rebounds = None
-        self._opp_defensive_rebounds = None
-        self._opp_total_rebounds = None
-        self._opp_assists = None
-        self._opp_steals = None
-        self._opp_blocks = None
-        self._opp_turnovers = None
-        self._opp_personal_fouls = None
-        self._opp_points = None
+        self._schedule = None
+        for field in self._STAT_FIELDS:
+            setattr(self, field, None)
 
         if team_name:
             team_data = self._retrieve_team_data(year, team_name)
@@ -100,6 +161,23 @@ class Team:
         """
         return self.__str__()
 
+    def refresh_schedule(self):
+        """
+        Download the team's schedule again.
+
+        The team's schedule is only pulled the first time it is requested and
+        the same instance is returned afterwards. Calling this method replaces
+        that instance with a newly-downloaded schedule, such as to include the
+        results of games which were played after it was first requested.
+
+        Returns
+        -------
+        Schedule instance
+            Returns the newly-downloaded Schedule instance for the team.
+        """
+        self._schedule = Schedule(self._abbreviation, self._year)
+        return self._schedule
+
     def _retrieve_team_data(self, year, team_name):
         """
         Pull all stats for a specific team.
@@ -118,9 +196,9 @@ class Team:
 
         Returns
         -------
-        PyQuery object
-            Returns a PyQuery object containing all stats and information for
-            the specified team.
+        list
+            Returns a ``list`` of every row element containing stats and
+            information for the specified team.
         """
         team_data_dict, year = _retrieve_all_teams(year)
         self._year = year
@@ -132,31 +210,36 @@ class Team:
         """
         Parses a value for every attribute.
 
-        This function looks through every attribute with the exception of
-        '_rank' and retrieves the value according to the parsing scheme and
-        index of the attribute from the passed HTML data. Once the value is
+        This function looks through every attribute listed in '_STAT_FIELDS'
+        and retrieves the value according to the parsing scheme and index of
+        the attribute from the passed HTML data. Once the value is
         retrieved, the attribute's value is updated with the returned result.
 
+        The passed HTML data is only parsed once, after which every stat is
+        read directly from the parsed row and converted to the type listed in
+        '_FIELD_TYPES'. The 'data-stat' attribute and type of every stat are
+        looked up ahead of time in '_STAT_PARSERS'.
+
         Note that this method is called directly once Team is invoked and does
         not need to be called manually.
 
         Parameters
         ----------
-        team_data : string
-            A string containing all of the rows of stats for a given team. If
-            multiple tables are being referenced, this will be comprised of
-            multiple rows in a single string.
-        """
-        for field in self.__dict__:
-            # The rank attribute is passed directly to the class during
-            # instantiation.
-            if field == '_rank' or \
-               field == '_year':
-                continue
-            value = utils._parse_field(PARSING_SCHEME,
-                                       team_data,
-                                       str(field)[1:])
-            setattr(self, field, value)
+        team_data : list
+            A list of the row elements of stats for a given team, with one row
+            from the team stats table followed by one row from the opponent
+            stats table.
+        """
+        # The abbreviation and name are both parsed from the team's link.
+        link = team_data[0].find('.//a')
+        self._abbreviation = utils._parse_abbreviation_from_uri(
+            link.get('href'))
+        # XML elements don't have 'text_content'.
+        self._name = ''.join(link.itertext())
+        # Both rows are parsed in the same pass. The opponent row only repeats
+        # the identifying cells, such as the games played, which are skipped
+        # as the values from the team stats row are kept.
+        utils._parse_stats(self, _STAT_PARSERS, team_data)
 
     @property
     def dataframe(self):
@@ -244,9 +327,13 @@ class Team:
     def schedule(self):
         """
         Returns an instance of the Schedule class containing the team's
-        complete schedule for the season.
+        complete schedule for the season. The schedule is only pulled the
+        first time it is requested. Use ``refresh_schedule`` to download it
+        again.
         """
-        return Schedule(self._abbreviation, self._year)
+        if self._schedule is None:
+            self._schedule = Schedule(self._abbreviation, self._year)
+        return self._schedule
 
     @property
     def roster(self):
@@ -264,7 +351,7 @@ class Team:
         """
         return self._name
 
-    @int_property_decorator
+    @property
     def games_played(self):
         """
         Returns an ``int`` of the total number of games the team has played
@@ -272,7 +359,7 @@ class Team:
         """
         return self._games_played
 
-    @int_property_decorator
+    @property
     def minutes_played(self):
         """
         Returns an ``int`` of the total number of minutes played by all players
@@ -280,7 +367,7 @@ class Team:
         """
         return self._minutes_played
 
-    @int_property_decorator
+    @property
     def field_goals(self):
         """
         Returns an ``int`` of the total number of field goals the team has made
@@ -288,7 +375,7 @@ class Team:
         """
         return self._field_goals
 
-    @int_property_decorator
+    @property
     def field_goal_attempts(self):
         """
         Returns an ``int`` of the total number of field goals the team has
@@ -296,7 +383,7 @@ class Team:
         """
         return self._field_goal_attempts
 
-    @float_property_decorator
+    @property
     def field_goal_percentage(self):
         """
         Returns a ``float`` of the percentage of field goals made divided by
@@ -304,7 +391,7 @@ class Team:
         """
         return self._field_goal_percentage
 
-    @int_property_decorator
+    @property
     def three_point_field_goals(self):
         """
         Returns an ``int`` of the total number of three point field goals the
@@ -312,7 +399,7 @@ class Team:
         """
         return self._three_point_field_goals
 
-    @int_property_decorator
+    @property
     def three_point_field_goal_attempts(self):
         """
         Returns an ``int`` of the total number of three point field goals the
@@ -320,7 +407,7 @@ class Team:
         """
         return self._three_point_field_goal_attempts
 
-    @float_property_decorator
+    @property
     def three_point_field_goal_percentage(self):
         """
         Returns a ``float`` of the percentage of three point field goals made
@@ -328,7 +415,7 @@ class Team:
         """
         return self._three_point_field_goal_percentage
 
-    @int_property_decorator
+    @property
     def two_point_field_goals(self):
         """
         Returns an ``int`` of the total number of two point field goals the
@@ -336,7 +423,7 @@ class Team:
         """
         return self._two_point_field_goals
 
-    @int_property_decorator
+    @property
     def two_point_field_goal_attempts(self):
         """
         Returns an ``int`` of the total number of two point field goals the
@@ -344,7 +431,7 @@ class Team:
         """
         return self._two_point_field_goal_attempts
 
-    @float_property_decorator
+    @property
     def two_point_field_goal_percentage(self):
         """
         Returns a ``float`` of the percentage of two point field goals made
@@ -352,7 +439,7 @@ class Team:
         """
         return self._two_point_field_goal_percentage
 
-    @int_property_decorator
+    @property
     def free_throws(self):
         """
         Returns an ``int`` of the total number of free throws made during the
@@ -360,7 +447,7 @@ class Team:
         """
         return self._free_throws
 
-    @int_property_decorator
+    @property
     def free_throw_attempts(self):
         """
         Returns an ``int`` of the total number of free throw attempts during
@@ -368,7 +455,7 @@ class Team:
         """
         return self._free_throw_attempts
 
-    @float_property_decorator
+    @property
     def free_throw_percentage(self):
         """
         Returns a ``float`` of the percentage of free throws made divided by
@@ -376,7 +463,7 @@ class Team:
         """
         return self._free_throw_percentage
 
-    @int_property_decorator
+    @property
     def offensive_rebounds(self):
         """
         Returns an ``int`` of the total number of offensive rebounds the team
@@ -384,7 +471,7 @@ class Team:
         """
         return self._offensive_rebounds
 
-    @int_property_decorator
+    @property
     def defensive_rebounds(self):
         """
         Returns an ``int`` of the total number of defensive rebounds the team
@@ -392,7 +479,7 @@ class Team:
         """
         return self._defensive_rebounds
 
-    @int_property_decorator
+    @property
     def total_rebounds(self):
         """
         Returns an ``int`` of the total number of rebounds the team has
@@ -400,7 +487,7 @@ class Team:
         """
         return self._total_rebounds
 
-    @int_property_decorator
+    @property
     def assists(self):
         """
         Returns an ``int`` of the total number of field goals that were
@@ -408,7 +495,7 @@ class Team:
         """
         return self._assists
 
-    @int_property_decorator
+    @property
     def steals(self):
         """
         Returns an ``int`` of the total number of times the team stole the ball
@@ -416,7 +503,7 @@ class Team:
         """
         return self._steals
 
-    @int_property_decorator
+    @property
     def blocks(self):
         """
         Returns an ``int`` of the total number of times the team blocked an
@@ -424,7 +511,7 @@ class Team:
         """
         return self._blocks
 
-    @int_property_decorator
+    @property
     def turnovers(self):
         """
         Returns an ``int`` of the total number of times the team has turned the
@@ -432,7 +519,7 @@ class Team:
         """
         return self._turnovers
 
-    @int_property_decorator
+    @property
     def personal_fouls(self):
         """
         Returns an ``int`` of the total number of times the team has fouled an
@@ -440,7 +527,7 @@ class Team:
         """
         return self._personal_fouls
 
-    @int_property_decorator
+    @property
     def points(self):
         """
         Returns an ``int`` of the total number of points the team has scored
@@ -448,7 +535,7 @@ class Team:
         """
         return self._points
 
-    @int_property_decorator
+    @property
     def opp_field_goals(self):
         """
         Returns an ``int`` of the total number of field goals the opponents
@@ -456,7 +543,7 @@ class Team:
         """
         return self._opp_field_goals
 
-    @int_property_decorator
+    @property
     def opp_field_goal_attempts(self):
         """
         Returns an ``int`` of the total number of field goals the opponents
@@ -464,7 +551,7 @@ class Team:
         """
         return self._opp_field_goal_attempts
 
-    @float_property_decorator
+    @property
     def opp_field_goal_percentage(self):
         """
         Returns a ``float`` of the percentage of field goals made divided by
@@ -472,7 +559,7 @@ class Team:
         """
         return self._opp_field_goal_percentage
 
-    @int_property_decorator
+    @property
     def opp_three_point_field_goals(self):
         """
         Returns an ``int`` of the total number of three point field goals the
@@ -480,7 +567,7 @@ class Team:
         """
         return self._opp_three_point_field_goals
 
-    @int_property_decorator
+    @property
     def opp_three_point_field_goal_attempts(self):
         """
         Returns an ``int`` of the total number of three point field goals the
@@ -488,7 +575,7 @@ class Team:
         """
         return self._opp_three_point_field_goal_attempts
 
-    @float_property_decorator
+    @property
     def opp_three_point_field_goal_percentage(self):
         """
         Returns a ``float`` of the percentage of three point field goals made
@@ -497,7 +584,7 @@ class Team:
         """
         return self._opp_three_point_field_goal_percentage
 
-    @int_property_decorator
+    @property
     def opp_two_point_field_goals(self):
         """
         Returns an ``int`` of the total number of two point field goals the
@@ -505,7 +592,7 @@ class Team:
         """
         return self._opp_two_point_field_goals
 
-    @int_property_decorator
+    @property
     def opp_two_point_field_goal_attempts(self):
         """
         Returns an ``int`` of the total number of two point field goals the
@@ -513,7 +600,7 @@ class Team:
         """
         return self._opp_two_point_field_goal_attempts
 
-    @float_property_decorator
+    @property
     def opp_two_point_field_goal_percentage(self):
         """
         Returns a ``float`` of the percentage of two point field goals made
@@ -522,7 +609,7 @@ class Team:
         """
         return self._opp_two_point_field_goal_percentage
 
-    @int_property_decorator
+    @property
     def opp_free_throws(self):
         """
         Returns an ``int`` of the total number of free throws made during the
@@ -530,7 +617,7 @@ class Team:
         """
         return self._opp_free_throws
 
-    @int_property_decorator
+    @property
     def opp_free_throw_attempts(self):
         """
         Returns an ``int`` of the total number of free throw attempts during
@@ -538,7 +625,7 @@ class Team:
         """
         return self._opp_free_throw_attempts
 
-    @float_property_decorator
+    @property
     def opp_free_throw_percentage(self):
         """
         Returns a ``float`` of the percentage of free throws made divided by
@@ -546,7 +633,7 @@ class Team:
         """
         return self._opp_free_throw_percentage
 
-    @int_property_decorator
+    @property
     def opp_offensive_rebounds(self):
         """
         Returns an ``int`` of the total number of offensive rebounds the
@@ -554,7 +641,7 @@ class Team:
         """
         return self._opp_offensive_rebounds
 
-    @int_property_decorator
+    @property
     def opp_defensive_rebounds(self):
         """
         Returns an ``int`` of the total number of defensive rebounds the
@@ -562,7 +649,7 @@ class Team:
         """
         return self._opp_defensive_rebounds
 
-    @int_property_decorator
+    @property
     def opp_total_rebounds(self):
         """
         Returns an ``int`` of the total number of rebounds the opponent
@@ -570,7 +657,7 @@ class Team:
         """
         return self._opp_total_rebounds
 
-    @int_property_decorator
+    @property
     def opp_assists(self):
         """
         Returns an ``int`` of the total number of field goals that were
@@ -578,7 +665,7 @@ class Team:
         """
         return self._opp_assists
 
-    @int_property_decorator
+    @property
     def opp_steals(self):
         """
         Returns an ``int`` of the total number of times the opponent stole the
@@ -586,7 +673,7 @@ class Team:
         """
         return self._opp_steals
 
-    @int_property_decorator
+    @property
     def opp_blocks(self):
         """
         Returns an ``int`` of the total number of times the opponent blocked
@@ -594,7 +681,7 @@ class Team:
         """
         return self._opp_blocks
 
-    @int_property_decorator
+    @property
     def opp_turnovers(self):
         """
         Returns an ``int`` of the total number of times the opponent turned the
@@ -602,7 +689,7 @@ class Team:
         """
         return self._opp_turnovers
 
-    @int_property_decorator
+    @property
     def opp_personal_fouls(self):
         """
         Returns an ``int`` of the total number of times the opponent fouled the
@@ -610,7 +697,7 @@ class Team:
         """
         return self._opp_personal_fouls
 
-    @int_property_decorator
+    @property
     def opp_points(self):
         """
         Returns an ``int`` of the total number of points the team has been
@@ -619,6 +706,13 @@ class Team:
         return self._opp_points
 
 
+_STAT_PARSERS = utils._compile_stat_parsers(
+    PARSING_SCHEME,
+    tuple(field for field in Team._STAT_FIELDS
+          if field not in ('_abbreviation', '_name')),
+    Team._FIELD_TYPES)
+
+
 class Teams:
     """
     A list of all NBA teams and their stats in a given year.
@@ -628,16 +722,26 @@ class Teams:
     that participated in the league in a given year. The Team class comprises
     a list of all major stats and a few identifiers for the requested season.
 
+    The season's page is reused for up to ten minutes after it is downloaded,
+    so stats updated on the site within that time aren't included.
+
     Parameters
     ----------
     year : string (optional)
         The requested year to pull stats from.
+    prefetch_schedules : boolean (optional)
+        Optionally download the schedule for every team in parallel while the
+        teams are being created instead of one at a time whenever a team's
+        schedule is first requested.
     """
-    def __init__(self, year=None):
+    def __init__(self, year=None, prefetch_schedules=False):
         self._teams = []
+        self._teams_by_abbreviation = {}
 
         team_data_dict, year = _retrieve_all_teams(year)
         self._instantiate_teams(team_data_dict, year)
+        if prefetch_schedules:
+            self._prefetch_schedules()
 
     def __getitem__(self, abbreviation):
         """
@@ -662,10 +766,13 @@ class Teams:
         ValueError
             If the requested team is not present within the Teams list.
         """
-        for team in self._teams:
-            if team.abbreviation.upper() == abbreviation.upper():
-                return team
-        raise ValueError('Team abbreviation %s not found' % abbreviation)
+        # Abbreviations are stored in uppercase, so the requested abbreviation
+        # only needs to be converted if it doesn't already match.
+        team = self._teams_by_abbreviation.get(abbreviation) or \
+            self._teams_by_abbreviation.get(abbreviation.upper())
+        if team is None:
+            raise ValueError('Team abbreviation %s not found' % abbreviation)
+        return team
 
     def __call__(self, abbreviation):
         """
@@ -715,7 +822,8 @@ class Teams:
 
         Once all team information has been pulled from the various webpages,
         create a Team instance for each team and append it to a larger list of
-        team instances for later use.
+        team instances for later use. Every team is also indexed by its
+        abbreviation to quickly find a requested team.
 
         Parameters
         ----------
@@ -732,6 +840,21 @@ class Teams:
                         rank=team_data['rank'],
                         year=year)
             self._teams.append(team)
+            # Abbreviations are already parsed in uppercase.
+            self._teams_by_abbreviation[team.abbreviation] = team
+
+    def _prefetch_schedules(self):
+        """
+        Download the schedule for every team in parallel.
+
+        Pulling a schedule is almost entirely spent waiting on the schedule
+        page to be downloaded, so requesting the pages from multiple threads
+        allows the downloads to overlap. Each schedule is saved to its team
+        and is returned directly once requested.
+        """
+        with ThreadPoolExecutor(max_workers=SCHEDULE_WORKERS) as executor:
+            # Consume the results to raise any errors from the threads.
+            list(executor.map(attrgetter('schedule'), self._teams))
 
     @property
     def dataframes(self):
@@ -740,6 +863,6 @@ class Teams:
         Team class. Rows are indexed by the team abbreviation.
         """
         frames = []
-        for team in self.__iter__():
+        for team in self._teams:
             frames.append(team.dataframe)
         return pd.concat(frames)
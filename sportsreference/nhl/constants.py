@@ -242,3 +242,7 @@ ROSTER_URL = 'https://www.hockey-reference.com/teams/%s/%s.html'
 
 SHOOTOUT = -1
 OVERTIME_LOSS = 'OTL'
+
+# The number of seconds a schedule saved to disk can be used for before it is
+# downloaded again.
+SCHEDULE_CACHE_MAX_AGE = 24 * 60 * 60
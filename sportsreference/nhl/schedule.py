@@ -1,10 +1,11 @@
 import pandas as pd
 import re
-from ..decorators import float_property_decorator, int_property_decorator
-from .constants import (SCHEDULE_SCHEME,
+from .constants import (SCHEDULE_CACHE_MAX_AGE,
+                        SCHEDULE_SCHEME,
                         SCHEDULE_URL)
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pyquery import PyQuery as pq
+from itertools import repeat
 from sportsreference import utils
 from sportsreference.constants import (WIN,
                                        LOSS,
@@ -12,11 +13,18 @@ from sportsreference.constants import (WIN,
                                        AWAY,
                                        NEUTRAL,
                                        REGULAR_SEASON,
-                                       CONFERENCE_TOURNAMENT)
+                                       CONFERENCE_TOURNAMENT,
+                                       SCHEDULE_WORKERS)
 from sportsreference.nhl.boxscore import Boxscore
 from sportsreference.nhl.constants import OVERTIME_LOSS, SHOOTOUT
 
 
+_DIGITS = re.compile(r'\d+')
+# Marks the links which haven't been parsed yet, as a game without a link is
+# saved as None.
+_UNPARSED = object()
+
+
 class Game:
     """
     A representation of a matchup between two teams.
@@ -31,12 +39,82 @@ class Game:
     year : string
         The year of the current season.
     """
+    # Every attribute which is read directly from a cell in the game's row.
+    _STAT_FIELDS = (
+        '_game',
+        '_date',
+        '_location',
+        '_opponent_name',
+        '_goals_scored',
+        '_goals_allowed',
+        '_result',
+        '_overtime',
+        '_shots_on_goal',
+        '_penalties_in_minutes',
+        '_power_play_goals',
+        '_power_play_opportunities',
+        '_short_handed_goals',
+        '_opp_shots_on_goal',
+        '_opp_penalties_in_minutes',
+        '_opp_power_play_goals',
+        '_opp_power_play_opportunities',
+        '_opp_short_handed_goals',
+        '_corsi_for',
+        '_corsi_against',
+        '_corsi_for_percentage',
+        '_fenwick_for',
+        '_fenwick_against',
+        '_fenwick_for_percentage',
+        '_faceoff_wins',
+        '_faceoff_losses',
+        '_faceoff_win_percentage',
+        '_offensive_zone_start_percentage',
+        '_pdo'
+    )
+    __slots__ = ('_datetime', '_game_data', '_boxscore', '_opponent_abbr',
+                 '_parsed_location', '_parsed_result', '_parsed_overtime') + \
+        _STAT_FIELDS
+
+    _FIELD_TYPES = {
+        'game': int,
+        'goals_scored': int,
+        'goals_allowed': int,
+        'shots_on_goal': int,
+        'penalties_in_minutes': int,
+        'power_play_goals': int,
+        'power_play_opportunities': int,
+        'short_handed_goals': int,
+        'opp_shots_on_goal': int,
+        'opp_penalties_in_minutes': int,
+        'opp_power_play_goals': int,
+        'opp_power_play_opportunities': int,
+        'opp_short_handed_goals': int,
+        'corsi_for': int,
+        'corsi_against': int,
+        'corsi_for_percentage': float,
+        'fenwick_for': int,
+        'fenwick_against': int,
+        'fenwick_for_percentage': float,
+        'faceoff_wins': int,
+        'faceoff_losses': int,
+        'faceoff_win_percentage': float,
+        'offensive_zone_start_percentage': float,
+        'pdo': float
+    }
+
     def __init__(self, game_data, year):
+        self._datetime = None
+        self._game_data = None
+        # The constants for the location, result, and number of overtimes are
+        # saved the first time they are requested.
+        self._parsed_location = None
+        self._parsed_result = None
+        self._parsed_overtime = None
         self._game = None
         self._date = None
-        self._boxscore = None
+        self._boxscore = _UNPARSED
         self._location = None
-        self._opponent_abbr = None
+        self._opponent_abbr = _UNPARSED
         self._opponent_name = None
         self._goals_scored = None
         self._goals_allowed = None
@@ -90,9 +168,16 @@ class Game:
         game_data : PyQuery object
             A PyQuery object containing the information specific to a game.
         """
-        name = game_data('td[data-stat="opp_name"]:first')
-        name = re.sub(r'.*/teams/', '', str(name))
-        name = re.sub('/.*', '', name)
+        link = game_data[0].find('td[@data-stat="opp_name"]/a')
+        if link is None:
+            setattr(self, '_opponent_abbr', None)
+            return
+        # The abbreviation is between '/teams/' and the next '/' in the link.
+        name = link.get('href', '')
+        index = name.rfind('/teams/')
+        if index != -1:
+            name = name[index + len('/teams/'):]
+        name = name.partition('/')[0]
         setattr(self, '_opponent_abbr', name)
 
     def _parse_boxscore(self, game_data):
@@ -107,50 +192,76 @@ class Game:
         game_data : PyQuery object
             A PyQuery object containing the information specific to a game.
         """
-        boxscore = game_data('td[data-stat="date_game"]:first')
-        boxscore = re.sub(r'.*/boxscores/', '', str(boxscore))
-        boxscore = re.sub(r'\.html.*', '', str(boxscore))
+        link = game_data[0].find('td[@data-stat="date_game"]/a')
+        # Games which haven't been played yet don't link to a boxscore.
+        if link is None:
+            setattr(self, '_boxscore', None)
+            return
+        boxscore = link.get('href', '')
+        index = boxscore.rfind('/boxscores/')
+        if index != -1:
+            boxscore = boxscore[index + len('/boxscores/'):]
+        boxscore = boxscore.partition('.html')[0]
         setattr(self, '_boxscore', boxscore)
 
+    def _parse_overtime(self):
+        """
+        Parses the number of overtimes that were played during the game.
+
+        Returns
+        -------
+        int
+            The number of overtimes that were played, or the SHOOTOUT constant
+            if the game went to a shootout.
+        """
+        if self._overtime == '':
+            return 0
+        overtime = self._overtime.lower()
+        if overtime == 'ot':
+            return 1
+        if overtime == 'so':
+            return SHOOTOUT
+        num = _DIGITS.findall(self._overtime)
+        if len(num) > 0:
+            return int(num[0])
+        return 0
+
     def _parse_game_data(self, game_data):
         """
         Parses a value for every attribute.
 
-        The function looks through every attribute with the exception of those
-        listed below and retrieves the value according to the parsing scheme
-        and index of the attribute from the passed HTML data. Once the value
-        is retrieved, the attribute's value is updated with the returned
-        result.
+        The function looks through every attribute listed in '_STAT_FIELDS'
+        and retrieves the value according to the parsing scheme and index of
+        the attribute from the passed HTML data. Once the value is retrieved,
+        the attribute's value is updated with the returned result. The
+        opponent's abbreviation and the boxscore are parsed separately once
+        they are first requested.
 
         Note that this method is called directory once Game is invoked and does
         not need to be called manually.
 
+        The passed HTML data is only parsed once, after which every field is
+        read directly from the parsed row and converted to the type listed in
+        '_FIELD_TYPES'.
+
         Parameters
         ----------
         game_data : string
             A string containing all of the rows of stats for a given game.
         """
-        for field in self.__dict__:
-            # Remove the leading '_' from the name
-            short_name = str(field)[1:]
-            if short_name == 'opponent_abbr':
-                self._parse_abbreviation(game_data)
-                continue
-            elif short_name == 'boxscore':
-                self._parse_boxscore(game_data)
-                continue
-            value = utils._parse_field(SCHEDULE_SCHEME, game_data, short_name)
-            setattr(self, field, value)
+        # The opponent's abbreviation and the boxscore are only parsed from
+        # the row once they are first requested.
+        self._game_data = game_data
+        utils._parse_stats(self, _STAT_PARSERS, game_data)
 
-    @property
-    def dataframe(self):
+    def _dataframe_fields(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the boxscore string.
+        Returns a dictionary of every property included in the game's
+        DataFrame, or None if the game doesn't have a score yet.
         """
         if self._goals_scored is None and self._goals_allowed is None:
             return None
-        fields_to_include = {
+        return {
             'boxscore_index': self.boxscore_index,
             'date': self.date,
             'datetime': self.datetime,
@@ -185,7 +296,17 @@ class Game:
             self.offensive_zone_start_percentage,
             'pdo': self.pdo
         }
-        return pd.DataFrame([fields_to_include], index=[self._boxscore])
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the boxscore string.
+        """
+        fields_to_include = self._dataframe_fields()
+        if fields_to_include is None:
+            return None
+        return pd.DataFrame([fields_to_include], index=[self.boxscore_index])
 
     @property
     def dataframe_extended(self):
@@ -197,13 +318,13 @@ class Game:
         """
         return self.boxscore.dataframe
 
-    @int_property_decorator
+    @property
     def game(self):
         """
         Returns an ``int`` to indicate which game in the season was requested.
         The first game of the season returns 1.
         """
-        return int(self._game)
+        return self._game
 
     @property
     def date(self):
@@ -219,7 +340,9 @@ class Game:
         Returns a datetime object to indicate the month, day, and year the game
         was played at.
         """
-        return datetime.strptime(self._date, '%Y-%m-%d')
+        if self._datetime is None:
+            self._datetime = datetime.strptime(self._date, '%Y-%m-%d')
+        return self._datetime
 
     @property
     def boxscore(self):
@@ -227,7 +350,7 @@ class Game:
         Returns an instance of the Boxscore class containing more detailed
         stats on the game.
         """
-        return Boxscore(self._boxscore)
+        return Boxscore(self.boxscore_index)
 
     @property
     def boxscore_index(self):
@@ -235,6 +358,10 @@ class Game:
         Returns a ``string`` of the URI for a boxscore which can be used to
         access or index a game.
         """
+        if self._boxscore is _UNPARSED:
+            self._boxscore = None
+            if self._game_data is not None:
+                self._parse_boxscore(self._game_data)
         return self._boxscore
 
     @property
@@ -243,9 +370,12 @@ class Game:
         Returns a ``string`` constant to indicate whether the game was played
         at home or away.
         """
-        if self._location == '@':
-            return AWAY
-        return HOME
+        if self._parsed_location is None:
+            if self._location == '@':
+                self._parsed_location = AWAY
+            else:
+                self._parsed_location = HOME
+        return self._parsed_location
 
     @property
     def opponent_abbr(self):
@@ -253,6 +383,10 @@ class Game:
         Returns a ``string`` of the opponent's 3-letter abbreviation, such as
         'NYR' for the New York Rangers.
         """
+        if self._opponent_abbr is _UNPARSED:
+            self._opponent_abbr = None
+            if self._game_data is not None:
+                self._parse_abbreviation(self._game_data)
         return self._opponent_abbr
 
     @property
@@ -263,7 +397,7 @@ class Game:
         """
         return self._opponent_name
 
-    @int_property_decorator
+    @property
     def goals_scored(self):
         """
         Returns an ``int`` of the number of goals the team scored during the
@@ -271,7 +405,7 @@ class Game:
         """
         return self._goals_scored
 
-    @int_property_decorator
+    @property
     def goals_allowed(self):
         """
         Returns an ``int`` of the number of goals the team allowed during the
@@ -285,31 +419,27 @@ class Game:
         Returns a ``string`` constant to indicate whether the team lost in
         regulation, lost in overtime, or won.
         """
-        if self._result.lower() == 'w':
-            return WIN
-        if self._result.lower() == 'l' and \
-           self.overtime != 0:
-            return OVERTIME_LOSS
-        return LOSS
+        if self._parsed_result is None:
+            result = self._result.lower()
+            if result == 'w':
+                self._parsed_result = WIN
+            elif result == 'l' and self.overtime != 0:
+                self._parsed_result = OVERTIME_LOSS
+            else:
+                self._parsed_result = LOSS
+        return self._parsed_result
 
-    @int_property_decorator
+    @property
     def overtime(self):
         """
         Returns an ``int`` of the number of overtimes that were played during
         the game, or an int constant if the game went to a shootout.
         """
-        if self._overtime.lower() == 'ot':
-            return 1
-        if self._overtime.lower() == 'so':
-            return SHOOTOUT
-        if self._overtime == '':
-            return 0
-        num = re.findall(r'\d+', self._overtime)
-        if len(num) > 0:
-            return num[0]
-        return 0
+        if self._parsed_overtime is None:
+            self._parsed_overtime = self._parse_overtime()
+        return self._parsed_overtime
 
-    @int_property_decorator
+    @property
     def shots_on_goal(self):
         """
         Returns an ``int`` of the total number of shots on goal the team
@@ -317,7 +447,7 @@ class Game:
         """
         return self._shots_on_goal
 
-    @int_property_decorator
+    @property
     def penalties_in_minutes(self):
         """
         Returns an ``int`` of the total number of minutes the team served for
@@ -325,14 +455,14 @@ class Game:
         """
         return self._penalties_in_minutes
 
-    @int_property_decorator
+    @property
     def power_play_goals(self):
         """
         Returns an ``int`` of the number of power play goals the team scored.
         """
         return self._power_play_goals
 
-    @int_property_decorator
+    @property
     def power_play_opportunities(self):
         """
         Returns an ``int`` of the number of power play opportunities the team
@@ -340,14 +470,14 @@ class Game:
         """
         return self._power_play_opportunities
 
-    @int_property_decorator
+    @property
     def short_handed_goals(self):
         """
         Returns an ``int`` of the number of shorthanded goals the team scored.
         """
         return self._short_handed_goals
 
-    @int_property_decorator
+    @property
     def opp_shots_on_goal(self):
         """
         Returns an ``int`` of the total number of shots on goal the opponent
@@ -355,7 +485,7 @@ class Game:
         """
         return self._opp_shots_on_goal
 
-    @int_property_decorator
+    @property
     def opp_penalties_in_minutes(self):
         """
         Returns an ``int`` of the total number of minutes the opponent served
@@ -363,7 +493,7 @@ class Game:
         """
         return self._opp_penalties_in_minutes
 
-    @int_property_decorator
+    @property
     def opp_power_play_goals(self):
         """
         Returns an ``int`` of the number of power play goals the opponent
@@ -371,7 +501,7 @@ class Game:
         """
         return self._opp_power_play_goals
 
-    @int_property_decorator
+    @property
     def opp_power_play_opportunities(self):
         """
         Returns an ``int`` of the number of power play opportunities the
@@ -379,7 +509,7 @@ class Game:
         """
         return self._opp_power_play_opportunities
 
-    @int_property_decorator
+    @property
     def opp_short_handed_goals(self):
         """
         Returns an ``int`` of the number of shorthanded goals the opponent
@@ -387,7 +517,7 @@ class Game:
         """
         return self._opp_short_handed_goals
 
-    @int_property_decorator
+    @property
     def corsi_for(self):
         """
         Returns an ``int`` of the Corsi For at Even Strength metric which
@@ -395,7 +525,7 @@ class Game:
         """
         return self._corsi_for
 
-    @int_property_decorator
+    @property
     def corsi_against(self):
         """
         Returns an ``int`` of the Corsi Against at Even Strength metric which
@@ -403,7 +533,7 @@ class Game:
         """
         return self._corsi_against
 
-    @float_property_decorator
+    @property
     def corsi_for_percentage(self):
         """
         Returns a ``float`` of the percentage of control a team had of the puck
@@ -414,7 +544,7 @@ class Game:
         """
         return self._corsi_for_percentage
 
-    @int_property_decorator
+    @property
     def fenwick_for(self):
         """
         Returns an ``int`` of the Fenwick For at Even Strength metric which
@@ -422,7 +552,7 @@ class Game:
         """
         return self._fenwick_for
 
-    @int_property_decorator
+    @property
     def fenwick_against(self):
         """
         Returns an ``int`` of the Fenwick Against at Even Strength metric which
@@ -430,7 +560,7 @@ class Game:
         """
         return self._fenwick_against
 
-    @float_property_decorator
+    @property
     def fenwick_for_percentage(self):
         """
         Returns a ``float`` of the percentage of control a team had of the puck
@@ -441,7 +571,7 @@ class Game:
         """
         return self._fenwick_for_percentage
 
-    @int_property_decorator
+    @property
     def faceoff_wins(self):
         """
         Returns an ``int`` of the number of faceoffs the team won at even
@@ -449,7 +579,7 @@ class Game:
         """
         return self._faceoff_wins
 
-    @int_property_decorator
+    @property
     def faceoff_losses(self):
         """
         Returns an ``int`` of the number of faceoffs the team lost at even
@@ -457,7 +587,7 @@ class Game:
         """
         return self._faceoff_losses
 
-    @float_property_decorator
+    @property
     def faceoff_win_percentage(self):
         """
         Returns a ``float`` of percentage of faceoffs the team won while at
@@ -465,7 +595,7 @@ class Game:
         """
         return self._faceoff_win_percentage
 
-    @float_property_decorator
+    @property
     def offensive_zone_start_percentage(self):
         """
         Returns a ``float`` of the percentage of stats that took place in the
@@ -475,7 +605,7 @@ class Game:
         """
         return self._offensive_zone_start_percentage
 
-    @float_property_decorator
+    @property
     def pdo(self):
         """
         Returns a ``float`` of the team's PDO at Even Strength metric which is
@@ -485,6 +615,11 @@ class Game:
         return self._pdo
 
 
+_STAT_PARSERS = utils._compile_stat_parsers(SCHEDULE_SCHEME,
+                                            Game._STAT_FIELDS,
+                                            Game._FIELD_TYPES)
+
+
 class Schedule:
     """
     An object of the given team's schedule.
@@ -498,10 +633,48 @@ class Schedule:
         A team's short name, such as 'NYR' for the New York Rangers.
     year : string (optional)
         The requested year to pull stats from.
+    cache_dir : string (optional)
+        Optionally save the downloaded schedule to the given directory. The
+        saved schedule is used instead of downloading it again for up to a
+        day, including in later sessions.
     """
-    def __init__(self, abbreviation, year=None):
+    def __init__(self, abbreviation, year=None, cache_dir=None):
         self._games = []
-        self._pull_schedule(abbreviation, year)
+        self._rows = []
+        self._year = year
+        self._pull_schedule(abbreviation, year, cache_dir)
+
+    @classmethod
+    def bulk(cls, abbreviations, year=None, workers=SCHEDULE_WORKERS,
+             cache_dir=None):
+        """
+        Return the schedules for multiple teams.
+
+        Downloads the schedule for every requested team in parallel.
+
+        Parameters
+        ----------
+        abbreviations : list
+            A list of the short names of every requested team, such as 'NYR'
+            for the New York Rangers.
+        year : string (optional)
+            The requested year to pull stats from.
+        workers : int (optional)
+            The maximum number of schedules to download at the same time.
+        cache_dir : string (optional)
+            Optionally save the downloaded schedules to the given directory.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of Schedule instances in the same order as the
+            requested abbreviations.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(cls,
+                                     abbreviations,
+                                     repeat(year),
+                                     repeat(cache_dir)))
 
     def __getitem__(self, index):
         """
@@ -509,7 +682,7 @@ class Schedule:
 
         Returns a specified game as requested by the index number in the array.
         The input index is 0-based and must be within the range of the schedule
-        array.
+        array. Games are only parsed the first time they are requested.
 
         Parameters
         ----------
@@ -521,7 +694,13 @@ class Schedule:
         Game instance
             If the requested game can be found, its Game instance is returned.
         """
-        return self._games[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._games)))]
+        game = self._games[index]
+        if game is None:
+            game = Game(self._rows[index], self._year)
+            self._games[index] = game
+        return game
 
     def __call__(self, date):
         """
@@ -548,10 +727,9 @@ class Schedule:
             If the requested date cannot be matched with a game in the
             schedule.
         """
-        for game in self._games:
-            if game.datetime.year == date.year and \
-               game.datetime.month == date.month and \
-               game.datetime.day == date.day:
+        date_string = date.strftime('%Y-%m-%d')
+        for game in self:
+            if game.date == date_string:
                 return game
         raise ValueError('No games found for requested date')
 
@@ -560,7 +738,7 @@ class Schedule:
         Return the string representation of the class.
         """
         games = [f'{game.date} - {game.opponent_abbr}'.strip()
-                 for game in self._games]
+                 for game in self]
         return '\n'.join(games)
 
     def __repr__(self):
@@ -573,20 +751,21 @@ class Schedule:
         """
         Returns an iterator of all of the games scheduled for the given team.
         """
-        return iter(self._games)
+        return (self[index] for index in range(len(self._games)))
 
     def __len__(self):
         """Returns the number of scheduled games for the given team."""
         return len(self._games)
 
-    def _pull_schedule(self, abbreviation, year):
+    def _pull_schedule(self, abbreviation, year, cache_dir=None):
         """
         Download and create objects for the team's schedule.
 
         Given a team abbreviation and season, first download the team's
-        schedule page and convert to a PyQuery object, then create a Game
-        instance for every game in the team's schedule and append it to the
-        '_games' property.
+        schedule page and convert to a PyQuery object, then save the row for
+        every game in the team's schedule. A Game instance is only created for
+        a row once the game is first requested, and is saved in the '_games'
+        property.
 
         Parameters
         ----------
@@ -594,6 +773,8 @@ class Schedule:
             A team's short name, such as 'NYR' for the New York Rangers.
         year : string
             The requested year to pull stats from.
+        cache_dir : string (optional)
+            The directory to save the downloaded schedule to, if any.
         """
         if not year:
             year = utils._find_year_for_season('nhl')
@@ -605,17 +786,21 @@ class Schedule:
                utils._url_exists(SCHEDULE_URL % (abbreviation,
                                                  str(int(year) - 1))):
                 year = str(int(year) - 1)
-        doc = pq(SCHEDULE_URL % (abbreviation, year))
+        doc = utils._pull_page(SCHEDULE_URL % (abbreviation, year),
+                               cache_dir,
+                               SCHEDULE_CACHE_MAX_AGE)
         schedule = utils._get_stats_table(doc, 'table#tm_gamelog_rs')
         if not schedule:
             utils._no_data_found()
             return
 
         for item in schedule:
-            if 'class="thead"' in str(item):
+            # Skip the header rows which are repeated throughout the table.
+            if 'thead' in item[0].get('class', '').split():
                 continue
-            game = Game(item, year)
-            self._games.append(game)
+            self._rows.append(item)
+        self._year = year
+        self._games = [None] * len(self._rows)
 
     @property
     def dataframe(self):
@@ -623,14 +808,20 @@ class Schedule:
         Returns a pandas DataFrame where each row is a representation of the
         Game class. Rows are indexed by the boxscore string.
         """
-        frames = []
+        records = []
+        index = []
         for game in self.__iter__():
-            df = game.dataframe
-            if df is not None:
-                frames.append(df)
-        if frames == []:
+            fields = game._dataframe_fields()
+            if fields is not None:
+                records.append(fields)
+                index.append(game.boxscore_index)
+        if records == []:
             return None
-        return pd.concat(frames)
+        frame = pd.DataFrame(records, index=index, dtype=object)
+        # Columns with a missing value are kept as objects containing None.
+        for column in frame.columns[frame.notnull().all()]:
+            frame[column] = frame[column].infer_objects()
+        return frame
 
     @property
     def dataframe_extended(self):
@@ -1,8 +1,13 @@
+import os
 import re
 import requests
+import time
 from datetime import datetime
+from hashlib import sha1
 from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
+from tempfile import mkstemp
+from urllib.error import HTTPError
 
 
 # {
@@ -23,6 +28,12 @@ SEASON_START_MONTH = {
     'nhl': {'start': 10, 'wrap': True}
 }
 
+# The patterns used to strip the relative link information surrounding a
+# team's abbreviation.
+_ABBREVIATION_SUFFIX = re.compile(r'/[0-9]+\..*htm.*')
+_ABBREVIATION_SCHOOLS_PREFIX = re.compile(r'/.*/schools/')
+_ABBREVIATION_TEAMS_PREFIX = re.compile(r'/teams/')
+
 
 def _todays_date():
     """
@@ -121,6 +132,65 @@ def _find_year_for_season(league):
         return today.year
 
 
+def _pull_page(url, cache_dir=None, max_age=86400):
+    """
+    Download and parse a page, optionally saving it to disk.
+
+    If a cache directory is given, the contents of the page are saved to a
+    file in the directory which is named after a hash of the URL. As long as
+    the file is younger than the maximum age, the page is read from the file
+    instead of being downloaded again, including in later sessions.
+
+    Parameters
+    ----------
+    url : string
+        A string representation of the URL to pull.
+    cache_dir : string (optional)
+        The directory to save downloaded pages in. If not given, the page is
+        always downloaded and nothing is saved.
+    max_age : int (optional)
+        The number of seconds a saved page can be used for before it is
+        downloaded again. Defaults to one day.
+
+    Returns
+    -------
+    PyQuery object
+        Returns a PyQuery object of the requested page.
+
+    Raises
+    ------
+    HTTPError
+        Raised if the page returns a non-2xx status code, matching PyQuery's
+        behavior when no cache directory is given. Nothing is saved.
+    """
+    if not cache_dir:
+        return pq(url)
+    path = os.path.join(cache_dir,
+                        '%s.html' % sha1(url.encode('utf-8')).hexdigest())
+    try:
+        if time.time() - os.path.getmtime(path) < max_age:
+            with open(path, 'r', encoding='utf8') as cached_page:
+                return pq(cached_page.read(), parser='html')
+    except OSError:
+        pass
+    response = requests.get(url, timeout=60)
+    if not 200 <= response.status_code < 300:
+        raise HTTPError(url, response.status_code, response.reason,
+                        response.headers, None)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a temporary file first so pages being downloaded from other
+    # threads never read a partially-written file.
+    handle, temporary_path = mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with open(handle, 'w', encoding='utf8') as cached_page:
+            cached_page.write(response.text)
+        os.replace(temporary_path, path)
+    except Exception:
+        os.remove(temporary_path)
+        raise
+    return pq(response.text, parser='html')
+
+
 def _parse_abbreviation(uri_link):
     """
     Returns a team's abbreviation.
@@ -142,9 +212,31 @@ def _parse_abbreviation(uri_link):
     string
         The shortened uppercase abbreviation for a given team.
     """
-    abbr = re.sub(r'/[0-9]+\..*htm.*', '', uri_link('a').attr('href'))
-    abbr = re.sub(r'/.*/schools/', '', abbr)
-    abbr = re.sub(r'/teams/', '', abbr)
+    return _parse_abbreviation_from_uri(uri_link('a').attr('href'))
+
+
+def _parse_abbreviation_from_uri(uri):
+    """
+    Returns a team's abbreviation from the URI of a team's page.
+
+    Strips all of the relative link information surrounding the abbreviation
+    in a URI, such as "/teams/nwe/2017.htm", and returns the abbreviation in
+    uppercase, such as "NWE". This is used by ``_parse_abbreviation`` and can
+    be called directly when the link's URI has already been pulled.
+
+    Parameters
+    ----------
+    uri : string
+        A URI which contains a team's abbreviation within other link contents.
+
+    Returns
+    -------
+    string
+        The shortened uppercase abbreviation for a given team.
+    """
+    abbr = _ABBREVIATION_SUFFIX.sub('', uri)
+    abbr = _ABBREVIATION_SCHOOLS_PREFIX.sub('', abbr)
+    abbr = _ABBREVIATION_TEAMS_PREFIX.sub('', abbr)
     return abbr.upper()
 
 
@@ -208,6 +300,144 @@ def _parse_field(parsing_scheme, html_data, field, index=0, strip=False):
         return None
 
 
+def _parse_row(html_data):
+    """
+    Parse every stat in an HTML table row with a single pass.
+
+    Walk every cell in the passed rows once and save the contents of each
+    cell according to its 'data-stat' attribute. Individual fields can then be
+    pulled from the returned dictionary using the 'data-stat' attributes
+    found by ``_compile_parsing_scheme``.
+
+    Parameters
+    ----------
+    html_data : PyQuery object or list
+        A PyQuery object or a list of row elements containing all of the rows
+        of stats for a given team. If multiple tables are being referenced,
+        this will be comprised of multiple rows.
+
+    Returns
+    -------
+    dictionary
+        A dictionary where every key is the 'data-stat' attribute of a cell
+        and every value is the text contained in that cell. If the same
+        attribute is found multiple times, only the first value is saved.
+    """
+    row = {}
+    for element in html_data:
+        for cell in element.iter('th', 'td'):
+            stat = cell.get('data-stat')
+            if not stat or stat in row:
+                continue
+            # XML elements don't have 'text_content', so the text of any
+            # children is joined manually.
+            if len(cell):
+                row[stat] = ''.join(cell.itertext()).strip()
+            else:
+                row[stat] = (cell.text or '').strip()
+    return row
+
+
+def _compile_parsing_scheme(parsing_scheme):
+    """
+    Find the 'data-stat' attribute for every field in a parsing scheme.
+
+    Rows which are parsed with ``_parse_row`` are indexed by the 'data-stat'
+    attribute of each cell. Pulling the attribute out of every PyQuery-readable
+    scheme is the same for every row, so it should only be done once, such as
+    when a module is first imported. The value of a field can then be read
+    from a parsed row using the field's 'data-stat' attribute as the key.
+
+    Parameters
+    ----------
+    parsing_scheme : dict
+        A dictionary of the parsing scheme to be used to find the desired
+        field. The key corresponds to the attribute name to parse, and the
+        value is a PyQuery-readable parsing scheme as a string (such as
+        'td[data-stat="wins"]').
+
+    Returns
+    -------
+    dictionary
+        A dictionary where every key is the attribute name to parse and every
+        value is the 'data-stat' attribute of the cell which contains it. Any
+        fields whose scheme doesn't reference a 'data-stat' attribute are not
+        included.
+    """
+    compiled_scheme = {}
+    for field, scheme in parsing_scheme.items():
+        stat = re.search(r'data-stat="([^"]+)"', scheme)
+        if stat:
+            compiled_scheme[field] = stat.group(1)
+    return compiled_scheme
+
+
+def _compile_stat_parsers(parsing_scheme, fields, field_types):
+    """
+    Pair every field with its 'data-stat' attribute and type.
+
+    The result is the same for every row, so it should only be built once,
+    such as when a module is first imported, and then passed to
+    ``_parse_stats``.
+
+    Parameters
+    ----------
+    parsing_scheme : dict
+        A dictionary of the parsing scheme to be used to find the desired
+        field. The key corresponds to the attribute name to parse, and the
+        value is a PyQuery-readable parsing scheme as a string.
+    fields : tuple
+        A tuple of the attribute names to set, each with a leading '_', such
+        as '_wins'.
+    field_types : dict
+        A dictionary of the type to convert each attribute to, keyed by the
+        attribute name without the leading '_'. Attributes which aren't
+        included are saved as strings.
+
+    Returns
+    -------
+    tuple
+        A tuple of (field, data-stat, type) tuples for every field.
+    """
+    compiled_scheme = _compile_parsing_scheme(parsing_scheme)
+    return tuple((field,
+                  compiled_scheme.get(field[1:]),
+                  field_types.get(field[1:]))
+                 for field in fields)
+
+
+def _parse_stats(instance, stat_parsers, html_data):
+    """
+    Set every stat on an instance from an HTML table row.
+
+    The row is parsed once with ``_parse_row`` and each value is converted to
+    the type listed in the stat parsers.
+
+    Parameters
+    ----------
+    instance : object
+        The object to set every attribute on.
+    stat_parsers : tuple
+        A tuple of (field, data-stat, type) tuples as returned by
+        ``_compile_stat_parsers``.
+    html_data : PyQuery object or list
+        A PyQuery object or a list of row elements containing all of the rows
+        of stats to parse.
+    """
+    row = _parse_row(html_data)
+    for field, stat, field_type in stat_parsers:
+        value = row.get(stat)
+        if field_type:
+            try:
+                value = field_type(value)
+            except (TypeError, ValueError):
+                # If there is no value, default to None. None is
+                # statistically different from 0 as a team who played and
+                # contributed nothing is different from one who didn't play.
+                value = None
+        setattr(instance, field, value)
+
+
 def _remove_html_comment_tags(html):
     """
     Returns the passed HTML contents with all comment tags removed while
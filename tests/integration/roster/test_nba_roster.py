@@ -1257,8 +1257,7 @@ class TestNBARoster:
             .should_receive('_parse_team_data') \
             .and_return(None)
         team = Team(None, 1, '2018')
-        mock_abbreviation = mock.PropertyMock(return_value='HOU')
-        type(team)._abbreviation = mock_abbreviation
+        team._abbreviation = 'HOU'
 
         assert len(team.roster.players) == 4
 
@@ -1266,8 +1265,6 @@ class TestNBARoster:
             assert player.name in ['James Harden', 'Tarik Black',
                                    'Ryan Anderson', 'Trevor Ariza']
 
-        type(team)._abbreviation = None
-
     @mock.patch('requests.get', side_effect=mock_pyquery)
     def test_roster_class_with_slim_parameter(self, *args, **kwargs):
         flexmock(utils) \
@@ -22,7 +22,7 @@ def read_file(filename):
     return open('%s' % filepath, 'r', encoding='utf8').read()
 
 
-def mock_pyquery(url):
+def mock_pyquery(url, timeout=None):
     class MockPQ:
         def __init__(self, html_contents):
             self.status_code = 200
@@ -113,6 +113,24 @@ class TestNHLSchedule:
         for attribute, value in self.results.items():
             assert getattr(match_two, attribute) == value
 
+    def test_nhl_schedule_only_parses_requested_games(self):
+        assert self.schedule._games.count(None) == NUM_GAMES_IN_SCHEDULE
+
+        match_two = self.schedule[1]
+
+        assert self.schedule._games.count(None) == NUM_GAMES_IN_SCHEDULE - 1
+        assert self.schedule[1] is match_two
+
+    @mock.patch('requests.get', side_effect=mock_pyquery)
+    def test_nhl_schedule_is_read_from_cache_dir(self, mock_get, tmpdir):
+        Schedule('NYR', cache_dir=str(tmpdir))
+        downloads = mock_get.call_count
+
+        schedule = Schedule('NYR', cache_dir=str(tmpdir))
+
+        assert mock_get.call_count == downloads
+        assert len(schedule) == NUM_GAMES_IN_SCHEDULE
+
     def test_nhl_schedule_returns_requested_match_from_date(self):
         match_two = self.schedule(datetime(2016, 10, 15))
 
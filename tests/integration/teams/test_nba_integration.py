@@ -5,6 +5,7 @@ import pytest
 from flexmock import flexmock
 from sportsreference import utils
 from sportsreference.nba.constants import SEASON_PAGE_URL
+from sportsreference.nba.schedule import Schedule
 from sportsreference.nba.teams import Team, Teams
 
 
@@ -151,6 +152,9 @@ class TestNBAIntegration:
         assert len(result) == len(self.abbreviations)
         assert set(result.columns.values) == set(self.results.keys())
 
+    def test_nba_lowercase_abbreviation_returns_team(self):
+        assert self.teams('det') is self.teams('DET')
+
     def test_nba_invalid_team_name_raises_value_error(self):
         with pytest.raises(ValueError):
             self.teams('INVALID_NAME')
@@ -167,6 +171,18 @@ class TestNBAIntegration:
 
         assert len(teams) == 0
 
+    def test_nba_prefetch_schedules_pulls_every_schedule(self):
+        flexmock(Schedule) \
+            .should_receive('_pull_schedule') \
+            .and_return(None) \
+            .times(len(self.abbreviations))
+
+        teams = Teams(prefetch_schedules=True)
+
+        for team in teams:
+            assert team._schedule is not None
+            assert len(team.schedule) == 0
+
     def test_pulling_team_directly(self):
         detroit = Team('DET')
 
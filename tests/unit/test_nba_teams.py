@@ -1,4 +1,5 @@
 from flexmock import flexmock
+from pyquery import PyQuery as pq
 from sportsreference.nba.schedule import Schedule
 from sportsreference.nba.teams import Team
 
@@ -15,3 +16,55 @@ class TestNBATeams:
         team = Team(None, 1)
 
         assert len(team.schedule) == 0
+
+    def test_nba_schedule_is_only_pulled_once(self, *args, **kwargs):
+        flexmock(Team) \
+            .should_receive('_parse_team_data') \
+            .and_return(None)
+        flexmock(Schedule) \
+            .should_receive('_pull_schedule') \
+            .and_return(None) \
+            .once()
+
+        team = Team(None, 1)
+
+        assert team.schedule is team.schedule
+
+    def test_nba_refresh_schedule_pulls_new_schedule(self, *args, **kwargs):
+        flexmock(Team) \
+            .should_receive('_parse_team_data') \
+            .and_return(None)
+        flexmock(Schedule) \
+            .should_receive('_pull_schedule') \
+            .and_return(None) \
+            .twice()
+
+        team = Team(None, 1)
+        schedule = team.schedule
+
+        assert team.refresh_schedule() is not schedule
+        assert team.schedule is not schedule
+
+    def test_nba_team_is_parsed_from_xml_row(self, *args, **kwargs):
+        # The row is valid XML, so PyQuery returns an XML element instead of
+        # an HTML element.
+        row = pq('<tr><td data-stat="team_name">'
+                 '<a href="/teams/GSW/2018.html">Golden State Warriors</a>'
+                 '</td><td data-stat="pts">9304</td></tr>')
+
+        team = Team(team_data=[row[0]], rank=1, year='2018')
+
+        assert team.name == 'Golden State Warriors'
+        assert team.abbreviation == 'GSW'
+        assert team.points == 9304
+
+    def test_nba_unparsed_team_returns_none(self, *args, **kwargs):
+        flexmock(Team) \
+            .should_receive('_parse_team_data') \
+            .and_return(None)
+
+        team = Team(None, 1)
+
+        assert team.points is None
+        assert team.name is None
+        assert team.dataframe['points'].isnull().all()
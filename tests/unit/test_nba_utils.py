@@ -1,7 +1,8 @@
 import mock
 from flexmock import flexmock
 from sportsreference import utils
-from sportsreference.nba.nba_utils import _retrieve_all_teams
+from sportsreference.nba.constants import SEASON_PAGE_URL
+from sportsreference.nba.nba_utils import _retrieve_all_teams, _SEASON_PAGES
 
 
 def mock_pyquery(url):
@@ -24,7 +25,14 @@ def mock_pyquery(url):
                       '<div id="all_opponent-stats-base"/>')
 
 
+def mock_pyquery_2021_exists(url):
+    return mock_pyquery(url.replace('2021', '2020'))
+
+
 class TestNBAUtils:
+    def setup_method(self, *args, **kwargs):
+        _SEASON_PAGES.clear()
+
     @mock.patch('requests.get', side_effect=mock_pyquery)
     def test_nba_2020_season_default_to_previous(self, *args, **kwargs):
         flexmock(utils) \
@@ -34,3 +42,34 @@ class TestNBAUtils:
         _, year = _retrieve_all_teams(None)
 
         assert year == '2020'
+
+    @mock.patch('requests.get', side_effect=mock_pyquery_2021_exists)
+    def test_nba_2021_season_page_only_pulled_once(self, mock_get):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2021)
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .and_return(True)
+
+        _, year = _retrieve_all_teams(None)
+
+        assert year == 2021
+        assert mock_get.call_count == 1
+
+    @mock.patch('requests.get', side_effect=mock_pyquery)
+    def test_nba_season_page_is_cached(self, mock_get):
+        _retrieve_all_teams('2020')
+        _retrieve_all_teams('2020')
+
+        assert mock_get.call_count == 1
+
+    @mock.patch('requests.get', side_effect=mock_pyquery)
+    def test_nba_expired_season_page_is_pulled_again(self, mock_get):
+        _retrieve_all_teams('2020')
+        url = SEASON_PAGE_URL % '2020'
+        _SEASON_PAGES[url] = (0, _SEASON_PAGES[url][1])
+
+        _retrieve_all_teams('2020')
+
+        assert mock_get.call_count == 2
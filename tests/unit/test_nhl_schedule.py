@@ -1,5 +1,7 @@
+from datetime import datetime
 from flexmock import flexmock
-from mock import PropertyMock
+from mock import patch
+from pyquery import PyQuery as pq
 from sportsreference.constants import (AWAY,
                                        HOME,
                                        LOSS,
@@ -23,238 +25,205 @@ class TestNHLSchedule:
         self.game = Game(None, YEAR)
 
     def test_away_game_returns_away_location(self):
-        fake_location = PropertyMock(return_value='@')
-        type(self.game)._location = fake_location
+        self.game._location = '@'
 
         assert self.game.location == AWAY
 
     def test_home_game_returns_home_location(self):
-        fake_location = PropertyMock(return_value='')
-        type(self.game)._location = fake_location
+        self.game._location = ''
 
         assert self.game.location == HOME
 
     def test_winning_result_returns_win(self):
-        fake_result = PropertyMock(return_value='W')
-        type(self.game)._result = fake_result
+        self.game._result = 'W'
 
         assert self.game.result == WIN
 
     def test_losing_result_in_overtime_returns_overtime_loss(self):
-        fake_result = PropertyMock(return_value='L')
-        type(self.game)._result = fake_result
-        fake_overtime = PropertyMock(return_value='OT')
-        type(self.game)._overtime = fake_overtime
+        self.game._result = 'L'
+        self.game._overtime = 'OT'
 
         assert self.game.result == OVERTIME_LOSS
 
     def test_losing_result_in_regulation_returns_loss(self):
-        fake_result = PropertyMock(return_value='L')
-        type(self.game)._result = fake_result
-        fake_overtime = PropertyMock(return_value='')
-        type(self.game)._overtime = fake_overtime
+        self.game._result = 'L'
+        self.game._overtime = ''
 
         assert self.game.result == LOSS
 
+    def test_result_is_only_parsed_once(self):
+        self.game._result = 'W'
+
+        assert self.game.result == WIN
+        assert self.game._parsed_result == WIN
+
+        self.game._result = 'L'
+
+        assert self.game.result == WIN
+
     def test_overtime_returns_one(self):
-        fake_overtime = PropertyMock(return_value='OT')
-        type(self.game)._overtime = fake_overtime
+        self.game._overtime = 'OT'
 
         assert self.game.overtime == 1
 
     def test_no_overtime_returns_zero(self):
-        fake_overtime = PropertyMock(return_value='')
-        type(self.game)._overtime = fake_overtime
+        self.game._overtime = ''
 
         assert self.game.overtime == 0
 
     def test_double_overtime_returns_two(self):
-        fake_overtime = PropertyMock(return_value='2OT')
-        type(self.game)._overtime = fake_overtime
+        self.game._overtime = '2OT'
 
         assert self.game.overtime == 2
 
     def test_shootout_returns_shootout_constant(self):
-        fake_overtime = PropertyMock(return_value='SO')
-        type(self.game)._overtime = fake_overtime
+        self.game._overtime = 'SO'
 
         assert self.game.overtime == SHOOTOUT
 
     def test_bad_overtime_returns_default_number(self):
-        fake_overtime = PropertyMock(return_value='BAD')
-        type(self.game)._overtime = fake_overtime
+        self.game._overtime = 'BAD'
 
         assert self.game.overtime == 0
 
-    def test_bad_shots_on_goal_returns_default_number(self):
-        fake_shots = PropertyMock(return_value='')
-        type(self.game)._shots_on_goal = fake_shots
-
-        assert self.game.shots_on_goal is None
-
-    def test_bad_penalties_in_minutes_returns_default_number(self):
-        fake_penalties = PropertyMock(return_value='')
-        type(self.game)._penalties_in_minutes = fake_penalties
-
-        assert self.game.penalties_in_minutes is None
-
-    def test_bad_power_play_goals_returns_default_number(self):
-        fake_power_play_goals = PropertyMock(return_value='')
-        type(self.game)._power_play_goals = fake_power_play_goals
-
-        assert self.game.power_play_goals is None
-
-    def test_bad_power_play_opportunities_returns_default_number(self):
-        fake_power_play_opps = PropertyMock(return_value='')
-        type(self.game)._power_play_opportunities = fake_power_play_opps
-
-        assert self.game.power_play_opportunities is None
-
-    def test_bad_short_handed_goals_returns_default_number(self):
-        fake_goals = PropertyMock(return_value='')
-        type(self.game)._short_handed_goals = fake_goals
+    def test_datetime_is_only_parsed_once(self):
+        self.game._date = '2017-10-05'
 
-        assert self.game.short_handed_goals is None
+        assert self.game.datetime == datetime(2017, 10, 5)
+        assert self.game.datetime is self.game.datetime
 
-    def test_bad_opp_shots_on_goal_returns_default_number(self):
-        fake_shots = PropertyMock(return_value='')
-        type(self.game)._opp_shots_on_goal = fake_shots
+    def test_links_are_parsed_from_href(self):
+        game_data = pq('<tr><td data-stat="date_game">'
+                       '<a href="/boxscores/201610150STL.html">2016-10-15</a>'
+                       '</td><td data-stat="opp_name">'
+                       '<a href="/teams/STL/2017.html">St. Louis Blues</a>'
+                       '</td></tr>')
 
-        assert self.game.opp_shots_on_goal is None
+        self.game._parse_abbreviation(game_data)
+        self.game._parse_boxscore(game_data)
 
-    def test_bad_opp_penalties_in_minutes_returns_default_number(self):
-        fake_penalties = PropertyMock(return_value='')
-        type(self.game)._opp_penalties_in_minutes = fake_penalties
+        assert self.game._opponent_abbr == 'STL'
+        assert self.game._boxscore == '201610150STL'
 
-        assert self.game.opp_penalties_in_minutes is None
+    def test_missing_links_return_none(self):
+        game_data = pq('<tr><td data-stat="date_game">2016-10-15</td>'
+                       '<td data-stat="opp_name">St. Louis Blues</td></tr>')
 
-    def test_bad_opp_power_play_goals_returns_default_number(self):
-        fake_power_play_goals = PropertyMock(return_value='')
-        type(self.game)._opp_power_play_goals = fake_power_play_goals
+        self.game._parse_abbreviation(game_data)
+        self.game._parse_boxscore(game_data)
 
-        assert self.game.opp_power_play_goals is None
+        assert self.game._opponent_abbr is None
+        assert self.game._boxscore is None
 
-    def test_bad_opp_power_play_opportunities_returns_default_number(self):
-        fake_power_play_opps = PropertyMock(return_value='')
-        type(self.game)._opp_power_play_opportunities = fake_power_play_opps
+    def test_game_has_no_instance_dictionary(self):
+        assert not hasattr(self.game, '__dict__')
 
-        assert self.game.opp_power_play_opportunities is None
-
-    def test_bad_opp_short_handed_goals_returns_default_number(self):
-        fake_goals = PropertyMock(return_value='')
-        type(self.game)._opp_short_handed_goals = fake_goals
-
-        assert self.game.opp_short_handed_goals is None
-
-    def test_bad_penalties_in_minutes_returns_default_number(self):
-        fake_penalties = PropertyMock(return_value='')
-        type(self.game)._penalties_in_minutes = fake_penalties
-
-        assert self.game.penalties_in_minutes is None
-
-    def test_bad_power_play_goals_returns_default_number(self):
-        fake_power_play_goals = PropertyMock(return_value='')
-        type(self.game)._power_play_goals = fake_power_play_goals
-
-        assert self.game.power_play_goals is None
-
-    def test_bad_power_play_opportunities_returns_default_number(self):
-        fake_power_play_opps = PropertyMock(return_value='')
-        type(self.game)._power_play_opportunities = fake_power_play_opps
-
-        assert self.game.power_play_opportunities is None
-
-    def test_bad_corsi_for_returns_default_number(self):
-        fake_corsi = PropertyMock(return_value='')
-        type(self.game)._corsi_for = fake_corsi
-
-        assert self.game.corsi_for is None
+    def test_empty_game_class_returns_dataframe_of_none(self):
+        assert self.game._goals_scored is None
+        assert self.game._goals_allowed is None
+        assert self.game.dataframe is None
 
-    def test_bad_corsi_against_returns_default_number(self):
-        fake_corsi = PropertyMock(return_value='')
-        type(self.game)._corsi_against = fake_corsi
+    def test_no_dataframes_returns_none(self):
+        flexmock(Schedule) \
+            .should_receive('_pull_schedule') \
+            .and_return(None)
+        schedule = Schedule('DET')
 
-        assert self.game.corsi_against is None
+        fake_game = flexmock(_dataframe_fields=lambda: None)
 
-    def test_bad_corsi_for_percentage_returns_default_number(self):
-        fake_corsi = PropertyMock(return_value='')
-        type(self.game)._corsi_for_percentage = fake_corsi
+        with patch.object(Schedule, '__iter__',
+                          return_value=iter([fake_game])):
+            assert schedule.dataframe is None
 
-        assert self.game.corsi_for_percentage is None
+    def test_no_dataframes_extended_returns_none(self):
+        flexmock(Schedule) \
+            .should_receive('_pull_schedule') \
+            .and_return(None)
+        schedule = Schedule('DET')
 
-    def test_bad_fenwick_for_returns_default_number(self):
-        fake_fenwick = PropertyMock(return_value='')
-        type(self.game)._fenwick_for = fake_fenwick
+        fake_game = flexmock(dataframe_extended=None)
 
-        assert self.game.fenwick_for is None
+        with patch.object(Schedule, '__iter__',
+                          return_value=iter([fake_game])):
+            assert schedule.dataframe_extended is None
 
-    def test_bad_fenwick_against_returns_default_number(self):
-        fake_fenwick = PropertyMock(return_value='')
-        type(self.game)._fenwick_against = fake_fenwick
+    def test_bulk_returns_schedule_for_every_team(self):
+        flexmock(Schedule) \
+            .should_receive('_pull_schedule') \
+            .and_return(None) \
+            .times(3)
 
-        assert self.game.fenwick_against is None
+        schedules = Schedule.bulk(['NYR', 'DET', 'BOS'], YEAR)
 
-    def test_bad_fenwick_for_percentage_returns_default_number(self):
-        fake_fenwick = PropertyMock(return_value='')
-        type(self.game)._fenwick_for_percentage = fake_fenwick
+        assert len(schedules) == 3
+        for schedule in schedules:
+            assert isinstance(schedule, Schedule)
+            assert schedule._year == YEAR
 
-        assert self.game.fenwick_for_percentage is None
 
-    def test_bad_faceoff_wins_returns_default_number(self):
-        fake_faceoff = PropertyMock(return_value='')
-        type(self.game)._faceoff_wins = fake_faceoff
+class TestNHLGameParsing:
+    def test_numeric_stats_are_converted_while_parsing(self):
+        game_data = pq('<tr><th data-stat="games">2</th>'
+                       '<td data-stat="opp_name">St. Louis Blues</td>'
+                       '<td data-stat="goals">2</td>'
+                       '<td data-stat="shots">35</td>'
+                       '<td data-stat="corsi_pct">52.3</td>'
+                       '<td data-stat="pdo">101.2</td></tr>')
 
-        assert self.game.faceoff_wins is None
+        game = Game(game_data, YEAR)
 
-    def test_bad_faceoff_losses_returns_default_number(self):
-        fake_faceoff = PropertyMock(return_value='')
-        type(self.game)._faceoff_losses = fake_faceoff
+        assert game.game == 2
+        assert game.goals_scored == 2
+        assert game.shots_on_goal == 35
+        assert game.corsi_for_percentage == 52.3
+        assert game.pdo == 101.2
+        assert game.opponent_name == 'St. Louis Blues'
 
-        assert self.game.faceoff_losses is None
+    def test_empty_stats_are_parsed_as_none(self):
+        game_data = pq('<tr><td data-stat="goals"></td>'
+                       '<td data-stat="shots"></td>'
+                       '<td data-stat="pen_min"></td>'
+                       '<td data-stat="corsi_pct"></td>'
+                       '<td data-stat="zs_offense_pct"></td></tr>')
 
-    def test_bad_faceoff_win_percentage_returns_default_number(self):
-        fake_faceoff = PropertyMock(return_value='')
-        type(self.game)._faceoff_win_percentage = fake_faceoff
+        game = Game(game_data, YEAR)
 
-        assert self.game.faceoff_win_percentage is None
+        assert game.goals_scored is None
+        assert game.shots_on_goal is None
+        assert game.penalties_in_minutes is None
+        assert game.corsi_for_percentage is None
+        assert game.offensive_zone_start_percentage is None
 
-    def test_bad_offensive_zone_start_percentage_returns_default_number(self):
-        fake_start = PropertyMock(return_value='')
-        type(self.game)._offensive_zone_start_percentage = fake_start
+    def test_non_numeric_stats_are_parsed_as_none(self):
+        game_data = pq('<tr><td data-stat="goals_pp">BAD</td>'
+                       '<td data-stat="faceoff_wins">1.5</td>'
+                       '<td data-stat="fenwick_pct">N/A</td></tr>')
 
-        assert self.game.offensive_zone_start_percentage is None
+        game = Game(game_data, YEAR)
 
-    def test_bad_pdo_returns_default_number(self):
-        fake_pdo = PropertyMock(return_value='')
-        type(self.game)._pdo = fake_pdo
+        assert game.power_play_goals is None
+        assert game.faceoff_wins is None
+        assert game.fenwick_for_percentage is None
 
-        assert self.game.pdo is None
+    def test_missing_stats_are_parsed_as_none(self):
+        game_data = pq('<tr><td data-stat="date_game">2016-10-15</td></tr>')
 
-    def test_empty_game_class_returns_dataframe_of_none(self):
-        assert self.game._goals_scored is None
-        assert self.game._goals_allowed is None
-        assert self.game.dataframe is None
+        game = Game(game_data, YEAR)
 
-    def test_no_dataframes_returns_none(self):
-        flexmock(Schedule) \
-            .should_receive('_pull_schedule') \
-            .and_return(None)
-        schedule = Schedule('DET')
+        for field in Game._FIELD_TYPES:
+            assert getattr(game, field) is None
 
-        fake_game = flexmock(dataframe=None)
-        fake_games = PropertyMock(return_value=fake_game)
-        type(schedule).__iter__ = fake_games
+    def test_missing_links_are_only_parsed_once(self):
+        game_data = pq('<tr><td data-stat="date_game">2016-10-15</td>'
+                       '<td data-stat="opp_name">St. Louis Blues</td></tr>')
 
-        assert schedule.dataframe is None
+        game = Game(game_data, YEAR)
 
-    def test_no_dataframes_extended_returns_none(self):
-        flexmock(Schedule) \
-            .should_receive('_pull_schedule') \
-            .and_return(None)
-        schedule = Schedule('DET')
+        assert game.boxscore_index is None
+        assert game.opponent_abbr is None
 
-        fake_game = flexmock(dataframe_extended=None)
-        fake_games = PropertyMock(return_value=fake_game)
-        type(schedule).__iter__ = fake_games
+        # Parsing the links from an empty row again would raise an error.
+        game._game_data = []
 
-        assert schedule.dataframe_extended is None
+        assert game.boxscore_index is None
+        assert game.opponent_abbr is None
@@ -1,6 +1,9 @@
+import pytest
 from mock import patch
 from flexmock import flexmock
+from pyquery import PyQuery as pq
 from sportsreference import utils
+from urllib.error import HTTPError
 
 
 class SeasonStarts:
@@ -199,6 +202,15 @@ class TestUtils:
             result = utils._parse_abbreviation(mock_html)
             assert result == abbreviation
 
+    def test_abbreviation_is_parsed_correctly_from_uri(self):
+        test_abbreviations = {'/teams/ARI/2018.shtml': 'ARI',
+                              '/cfb/schools/clemson/2017.html': 'CLEMSON',
+                              '/teams/GSW/2018.html': 'GSW'}
+
+        for uri, abbreviation in test_abbreviations.items():
+            result = utils._parse_abbreviation_from_uri(uri)
+            assert result == abbreviation
+
     def test__parse_field_returns_abbreviation(self):
         parsing_scheme = {'abbreviation': 'a'}
         input_abbreviation = '/teams/ARI/2018.shtml'
@@ -238,6 +250,83 @@ class TestUtils:
                                     'batters_used')
         assert result == expected
 
+    def test__parse_row_returns_first_value_for_every_stat(self):
+        html_string = '''<tr>
+<th class="right " data-stat="ranker">1</th>
+<td class="right " data-stat="batters_used">32</td>
+<td class="right " data-stat="age_bat">29.1</td>
+</tr>
+<tr>
+<td class="right " data-stat="batters_used">40</td>
+<td class="right " data-stat="runs_per_game">4.10</td>
+</tr>'''
+        expected = {'ranker': '1',
+                    'batters_used': '32',
+                    'age_bat': '29.1',
+                    'runs_per_game': '4.10'}
+
+        result = utils._parse_row(pq(html_string))
+
+        assert result == expected
+
+    def test__parse_row_returns_text_of_nested_elements(self):
+        html_string = '''<tr>
+<td data-stat="opp_name"><a href="/teams/STL/">St. Louis Blues</a></td>
+<td class="right " data-stat="goals">2</td>
+</tr>'''
+        expected = {'opp_name': 'St. Louis Blues', 'goals': '2'}
+
+        # The row is valid XML, so PyQuery returns an XML element instead of
+        # an HTML element.
+        result = utils._parse_row(pq(html_string))
+
+        assert result == expected
+
+    def test__compile_parsing_scheme_returns_data_stats(self):
+        parsing_scheme = {'batters_used': 'td[data-stat="batters_used"]:first',
+                          'games': 'th[data-stat="g"]:first',
+                          'name': 'a'}
+        expected = {'batters_used': 'batters_used', 'games': 'g'}
+
+        result = utils._compile_parsing_scheme(parsing_scheme)
+
+        assert result == expected
+
+    def test__compile_stat_parsers_pairs_fields_with_stats_and_types(self):
+        parsing_scheme = {'batters_used': 'td[data-stat="batters_used"]:first',
+                          'name': 'a'}
+        fields = ('_batters_used', '_name')
+        expected = (('_batters_used', 'batters_used', int),
+                    ('_name', None, None))
+
+        result = utils._compile_stat_parsers(parsing_scheme,
+                                             fields,
+                                             {'batters_used': int})
+
+        assert result == expected
+
+    def test__parse_stats_sets_typed_values(self):
+        html_string = '''<tr>
+<td class="right " data-stat="batters_used">32</td>
+<td class="right " data-stat="age_bat">29.1</td>
+<td class="right " data-stat="runs_per_game"></td>
+<td class="left " data-stat="team_name">Houston Astros</td>
+</tr>'''
+        stat_parsers = (('_batters_used', 'batters_used', int),
+                        ('_age_bat', 'age_bat', float),
+                        ('_runs_per_game', 'runs_per_game', float),
+                        ('_wins', 'wins', int),
+                        ('_name', 'team_name', None))
+        instance = flexmock()
+
+        utils._parse_stats(instance, stat_parsers, pq(html_string))
+
+        assert instance._batters_used == 32
+        assert instance._age_bat == 29.1
+        assert instance._runs_per_game is None
+        assert instance._wins is None
+        assert instance._name == 'Houston Astros'
+
     def test__get_stats_table_returns_correct_table(self):
         html_string = '''<div>
     <table class="stats_table" id="all_stats">
@@ -287,6 +376,69 @@ class TestUtils:
 
         assert not response
 
+    def test_pull_page_without_cache_dir_downloads_page(self):
+        flexmock(utils) \
+            .should_receive('pq') \
+            .with_args('http://www.good_url.com') \
+            .and_return('page') \
+            .once()
+
+        assert utils._pull_page('http://www.good_url.com') == 'page'
+
+    def test_pull_page_reads_saved_page(self, tmpdir):
+        response = flexmock(status_code=200, text='<html><p>page</p></html>')
+        flexmock(utils.requests) \
+            .should_receive('get') \
+            .with_args('http://www.good_url.com', timeout=60) \
+            .and_return(response) \
+            .once()
+
+        first = utils._pull_page('http://www.good_url.com', str(tmpdir))
+        second = utils._pull_page('http://www.good_url.com', str(tmpdir))
+
+        assert first('p').text() == 'page'
+        assert second('p').text() == 'page'
+        assert len(tmpdir.listdir()) == 1
+
+    def test_pull_page_downloads_expired_page_again(self, tmpdir):
+        response = flexmock(status_code=200, text='<html><p>page</p></html>')
+        flexmock(utils.requests) \
+            .should_receive('get') \
+            .and_return(response) \
+            .twice()
+
+        utils._pull_page('http://www.good_url.com', str(tmpdir), max_age=0)
+        utils._pull_page('http://www.good_url.com', str(tmpdir), max_age=0)
+
+    def test_pull_page_removes_partial_file_if_saving_fails(self, tmpdir):
+        response = flexmock(status_code=200, text='<html><p>page</p></html>')
+        flexmock(utils.requests) \
+            .should_receive('get') \
+            .and_return(response)
+        flexmock(utils.os) \
+            .should_receive('replace') \
+            .and_raise(OSError)
+
+        with pytest.raises(OSError):
+            utils._pull_page('http://www.good_url.com', str(tmpdir))
+
+        assert len(tmpdir.listdir()) == 0
+
+    def test_pull_page_raises_on_error_pages(self, tmpdir):
+        response = flexmock(status_code=404, reason='Not Found', headers={},
+                            text='<html></html>')
+        flexmock(utils.requests) \
+            .should_receive('get') \
+            .and_return(response) \
+            .twice()
+
+        with pytest.raises(HTTPError):
+            utils._pull_page('http://www.404.com', str(tmpdir))
+        with pytest.raises(HTTPError):
+            utils._pull_page('http://www.404.com', str(tmpdir))
+
+        assert len(tmpdir.listdir()) == 0
+
     def test_no_data_found_returns_safely(self, *args, **kwargs):
         response = utils._no_data_found()
 